@@ -15,8 +15,86 @@ Author: Built by Andrew using modern development practices including AI-assisted
 """
 
 import json
+import os
+import re
 import sys
-from datetime import datetime
+from collections import Counter
+from functools import lru_cache
+
+# Use orjson for faster parsing when it's installed, otherwise fall back to the
+# standard library. orjson.JSONDecodeError subclasses json.JSONDecodeError, so
+# the error handling in main() covers both.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# ijson lets huge files be streamed one conversation at a time instead of
+# loading the whole document into memory
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Errors that mean the file isn't valid JSON (ijson raises its own while streaming)
+if ijson is not None:
+    _JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError)
+else:
+    _JSON_ERRORS = (json.JSONDecodeError,)
+
+# Files larger than this are streamed with ijson (when installed)
+_STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+
+# Matches everything that isn't a letter, digit or whitespace (underscore counts
+# as punctuation here), so stripping it reproduces the old per-character clean-up
+_PUNCTUATION_RE = re.compile(r'[^\w\s]|_')
+
+# Words to ignore (common words that don't indicate topics)
+_STOP_WORDS = frozenset({
+    'the', 'be', 'to', 'of', 'and', 'a', 'in', 'that', 'have', 'i',
+    'it', 'for', 'not', 'on', 'with', 'he', 'as', 'you', 'do', 'at',
+    'this', 'but', 'his', 'by', 'from', 'they', 'we', 'say', 'her', 'she',
+    'or', 'an', 'will', 'my', 'one', 'all', 'would', 'there', 'their',
+    'what', 'so', 'up', 'out', 'if', 'about', 'who', 'get', 'which', 'go',
+    'me', 'when', 'make', 'can', 'like', 'time', 'no', 'just', 'him', 'know',
+    'take', 'into', 'your', 'some', 'could', 'them', 'see', 'other', 'than',
+    'then', 'now', 'look', 'only', 'come', 'its', 'over', 'think', 'also',
+    'back', 'after', 'use', 'two', 'how', 'our', 'work', 'first', 'well',
+    'way', 'even', 'new', 'want', 'because', 'any', 'these', 'give', 'day',
+    'most', 'us', 'is', 'was', 'are', 'been', 'has', 'had', 'were', 'said',
+    'did', 'having', 'may', 'am', 'are', 'im', 'youre', 'thats', 'dont',
+    'ive', 'isnt', 'arent', 'wasnt', 'werent', 'wont', 'cant', 'couldnt'
+})
+
+# Period of day for each hour (0-23):
+# Night 10 PM - 6 AM, Morning 6 AM - 12 PM, Afternoon 12 PM - 5 PM, Evening 5 PM - 10 PM
+_PERIOD_BY_HOUR = (
+    ("Night",) * 6 + ("Morning",) * 6 + ("Afternoon",) * 5 +
+    ("Evening",) * 5 + ("Night",) * 2
+)
+
+
+def _date_from_filename(filepath):
+    """
+    Extract the date from a filename like "daily_conversations_2025-10-25.json".
+    
+    Args:
+        filepath: Path to the JSON file
+        
+    Returns:
+        Date string, or "Unknown Date" if the filename doesn't contain one
+    """
+    filename = os.path.basename(filepath)
+    date = "Unknown Date"
+    if "20" in filename:  # Simple heuristic for year
+        parts = filename.split('_')
+        for part in parts:
+            if part.startswith('20') and '.json' in part:
+                date = part.replace('.json', '')
+                break
+    return date
 
 
 def load_conversation_file(filepath):
@@ -32,9 +110,9 @@ def load_conversation_file(filepath):
     Returns:
         Dictionary containing the conversation data in standardized format
     """
-    # Open the file and read it
-    with open(filepath, 'r', encoding='utf-8') as file:
-        raw_data = json.load(file)
+    # Read the raw bytes in one go and let the parser handle the UTF-8 decoding
+    with open(filepath, 'rb') as file:
+        raw_data = _json_loads(file.read())
     
     # Check if it's the new format (dict with 'conversations' key) or old format (direct list)
     if isinstance(raw_data, dict) and 'conversations' in raw_data:
@@ -42,26 +120,50 @@ def load_conversation_file(filepath):
         return raw_data
     elif isinstance(raw_data, list):
         # Old format - wrap it in the expected structure
-        # Extract date from filename if possible, otherwise use "Unknown"
-        import os
-        filename = os.path.basename(filepath)
-        # Try to extract date from filename like "daily_conversations_2025-10-25.json"
-        date = "Unknown Date"
-        if "20" in filename:  # Simple heuristic for year
-            parts = filename.split('_')
-            for part in parts:
-                if part.startswith('20') and '.json' in part:
-                    date = part.replace('.json', '')
-                    break
-        
         return {
-            'date': date,
+            'date': _date_from_filename(filepath),
             'conversations': raw_data
         }
     else:
         raise ValueError("Unrecognized JSON format")
 
 
+def _iter_json_items(filepath, prefix):
+    """
+    Lazily yield the JSON values found at an ijson prefix, keeping the file
+    open only while iterating.
+    """
+    with open(filepath, 'rb') as file:
+        yield from ijson.items(file, prefix, use_float=True)
+
+
+def stream_conversation_file(filepath):
+    """
+    Stream a conversation JSON file one conversation at a time (requires ijson).
+    Handles the same two formats as load_conversation_file(), but never holds
+    more than one conversation in memory.
+    
+    Args:
+        filepath: Path to the JSON file
+        
+    Returns:
+        Tuple of (date string, iterator of conversation dictionaries)
+    """
+    # Peek at the first character to tell the new format from the old one
+    with open(filepath, 'rb') as file:
+        first_char = file.read(64).lstrip()[:1]
+    
+    if first_char == b'{':
+        # New format - the date is usually the first key, so this stops early
+        date = next(_iter_json_items(filepath, 'date'), "Unknown Date")
+        return date, _iter_json_items(filepath, 'conversations.item')
+    elif first_char == b'[':
+        # Old format - direct array of conversations
+        return _date_from_filename(filepath), _iter_json_items(filepath, 'item')
+    else:
+        raise ValueError("Unrecognized JSON format")
+
+
 def detect_participants(data):
     """
     Detect participant names from the conversation data.
@@ -81,69 +183,24 @@ def detect_participants(data):
     return sorted(list(participants))  # Sort for consistent ordering
 
 
-def extract_topics(data, top_n=15):
+@lru_cache(maxsize=1024)  # Timestamps repeat a lot, so reuse earlier parses
+def _parse_hm(time_string):
     """
-    Extract main topics from conversations using keyword frequency.
+    Parse a time string into minutes since midnight.
     
     Args:
-        data: Dictionary from load_conversation_file()
-        top_n: Number of top topics to return
+        time_string: String like "03:03 PM"
         
     Returns:
-        List of (word, count) tuples sorted by frequency
+        Integer minutes since midnight (0-1439)
     """
-    # Words to ignore (common words that don't indicate topics)
-    stop_words = {
-        'the', 'be', 'to', 'of', 'and', 'a', 'in', 'that', 'have', 'i',
-        'it', 'for', 'not', 'on', 'with', 'he', 'as', 'you', 'do', 'at',
-        'this', 'but', 'his', 'by', 'from', 'they', 'we', 'say', 'her', 'she',
-        'or', 'an', 'will', 'my', 'one', 'all', 'would', 'there', 'their',
-        'what', 'so', 'up', 'out', 'if', 'about', 'who', 'get', 'which', 'go',
-        'me', 'when', 'make', 'can', 'like', 'time', 'no', 'just', 'him', 'know',
-        'take', 'into', 'your', 'some', 'could', 'them', 'see', 'other', 'than',
-        'then', 'now', 'look', 'only', 'come', 'its', 'over', 'think', 'also',
-        'back', 'after', 'use', 'two', 'how', 'our', 'work', 'first', 'well',
-        'way', 'even', 'new', 'want', 'because', 'any', 'these', 'give', 'day',
-        'most', 'us', 'is', 'was', 'are', 'been', 'has', 'had', 'were', 'said',
-        'did', 'having', 'may', 'am', 'are', 'im', 'youre', 'thats', 'dont',
-        'ive', 'isnt', 'arent', 'wasnt', 'werent', 'wont', 'cant', 'couldnt'
-    }
-    
-    # Dictionary to count word frequencies
-    word_counts = {}
-    
-    # Loop through all conversations and messages
-    for conversation in data['conversations']:
-        for message in conversation['messages']:
-            # Get the content (handle both string and nested structures)
-            if isinstance(message['content'], str):
-                content = message['content']
-            else:
-                content = str(message['content'])
-            
-            # Convert to lowercase and split into words
-            words = content.lower().split()
-            
-            # Count each word
-            for word in words:
-                # Clean the word (remove punctuation)
-                clean_word = ''.join(c for c in word if c.isalnum())
-                
-                # Skip if empty, too short, or a stop word
-                if len(clean_word) < 3 or clean_word in stop_words:
-                    continue
-                
-                # Count it
-                if clean_word in word_counts:
-                    word_counts[clean_word] += 1
-                else:
-                    word_counts[clean_word] = 1
-    
-    # Sort by frequency (most common first)
-    sorted_topics = sorted(word_counts.items(), key=lambda x: x[1], reverse=True)
-    
-    # Return top N
-    return sorted_topics[:top_n]
+    # Split "03:03 PM" into hours, minutes and AM/PM by hand (much cheaper than strptime)
+    hours, rest = time_string.split(':', 1)
+    minutes, meridiem = rest.split()
+    hour = int(hours) % 12  # 12 AM -> 0, 12 PM -> 12 below
+    if meridiem.upper() == 'PM':
+        hour += 12
+    return hour * 60 + int(minutes)
 
 
 def categorize_time_period(time_string):
@@ -156,19 +213,7 @@ def categorize_time_period(time_string):
     Returns:
         String: "Morning", "Afternoon", "Evening", or "Night"
     """
-    # Convert to datetime to get the hour
-    time_obj = datetime.strptime(time_string, "%I:%M %p")
-    hour = time_obj.hour  # 24-hour format (0-23)
-    
-    # Categorize based on hour
-    if 6 <= hour < 12:
-        return "Morning"
-    elif 12 <= hour < 17:  # 17 = 5 PM
-        return "Afternoon"
-    elif 17 <= hour < 22:  # 22 = 10 PM
-        return "Evening"
-    else:
-        return "Night"
+    return _PERIOD_BY_HOUR[_parse_hm(time_string) // 60]
 
 
 def calculate_duration(start_time, end_time):
@@ -182,34 +227,29 @@ def calculate_duration(start_time, end_time):
     Returns:
         Duration in minutes
     """
-    # Convert time strings to datetime objects
-    start = datetime.strptime(start_time, "%I:%M %p")
-    end = datetime.strptime(end_time, "%I:%M %p")
-    
-    # Calculate difference
-    duration = (end - start).total_seconds() / 60  # Convert to minutes
-    return int(duration)
+    # Wrap around midnight so an 11:50 PM - 12:10 AM conversation is 20 minutes
+    return (_parse_hm(end_time) - _parse_hm(start_time)) % 1440
 
 
-def get_basic_stats(data):
+def analyze_conversations(conversations, date, top_n=15):
     """
-    Calculate basic statistics from conversation data.
+    Calculate statistics and extract topics in a single pass over the conversations.
+    Works on any iterable, so conversations can be streamed from disk.
     
     Args:
-        data: Dictionary from load_conversation_file()
+        conversations: Iterable of conversation dictionaries
+        date: Date string for the report
+        top_n: Number of top topics to return
         
     Returns:
-        Dictionary with statistics
+        Tuple of (stats dictionary, list of (word, count) topic tuples)
     """
-    # Detect participants dynamically
-    participants = detect_participants(data)
-    
     stats = {
-        'date': data['date'],
-        'num_conversations': len(data['conversations']),
+        'date': date,
+        'num_conversations': 0,
         'total_messages': 0,
-        'participants': participants,
-        'messages_by_participant': {p: 0 for p in participants},
+        'participants': [],
+        'messages_by_participant': {},
         'conversation_lengths': [],
         'shortest_conversation': None,
         'longest_conversation': None,
@@ -220,13 +260,26 @@ def get_basic_stats(data):
             'Evening': 0,
             'Night': 0
         },
-        # Conversation flow tracking
-        'conversations_started_by': {p: 0 for p in participants},
-        'message_lengths_by_participant': {p: [] for p in participants}
+        # Conversation flow tracking (filled in once all participants are seen)
+        'conversations_started_by': {},
+        # [count, total length, longest] per participant
+        'msg_len_stats': {}
     }
     
+    # Counter to tally word frequencies
+    word_counts = Counter()
+    
+    # Per-participant counters live in plain lists indexed by participant number
+    # (assigned on first sight) so the inner loop avoids nested dict lookups
+    total_messages = 0
+    role_to_idx = {}
+    msg_count = []
+    msg_sum = []
+    msg_max = []
+    started = []
+    
     # Loop through each conversation
-    for i, conversation in enumerate(data['conversations']):
+    for i, conversation in enumerate(conversations):
         # Count messages in THIS conversation
         message_count = len(conversation['messages'])
         
@@ -240,10 +293,6 @@ def get_basic_stats(data):
         time_period = categorize_time_period(conversation['start_time'])
         stats['time_periods'][time_period] += message_count
         
-        # Track who started this conversation (first message)
-        first_speaker = conversation['messages'][0]['role']
-        stats['conversations_started_by'][first_speaker] += 1
-        
         # Store the length info
         conv_info = {
             'index': i + 1,
@@ -254,6 +303,7 @@ def get_basic_stats(data):
             'time_period': time_period
         }
         stats['conversation_lengths'].append(conv_info)
+        stats['num_conversations'] += 1
         
         # Track shortest and longest
         if stats['shortest_conversation'] is None or message_count < stats['shortest_conversation']['message_count']:
@@ -262,22 +312,102 @@ def get_basic_stats(data):
         if stats['longest_conversation'] is None or message_count > stats['longest_conversation']['message_count']:
             stats['longest_conversation'] = conv_info
         
+        # Message contents for this conversation, tokenized together below
+        contents = []
+        
         # Loop through each message in the conversation
         for message in conversation['messages']:
-            stats['total_messages'] += 1
+            total_messages += 1
+            
+            # Get the content once (handle both string and nested structures)
+            content = message['content']
+            if type(content) is not str:
+                content = str(content)
+            contents.append(content)
             
             # Get message length (character count)
-            if isinstance(message['content'], str):
-                msg_length = len(message['content'])
-            else:
-                msg_length = len(str(message['content']))
+            msg_length = len(content)
             
             # Track by participant
-            participant = message['role']
-            stats['messages_by_participant'][participant] += 1
-            stats['message_lengths_by_participant'][participant].append(msg_length)
+            idx = role_to_idx.get(message['role'])
+            if idx is None:
+                idx = role_to_idx[message['role']] = len(msg_count)
+                msg_count.append(0)
+                msg_sum.append(0)
+                msg_max.append(0)
+                started.append(0)
+            msg_count[idx] += 1
+            msg_sum[idx] += msg_length
+            if msg_length > msg_max[idx]:
+                msg_max[idx] = msg_length
+        
+        # Track who started this conversation (first message)
+        started[role_to_idx[conversation['messages'][0]['role']]] += 1
+        
+        # Lowercase, strip punctuation and split the whole conversation at once
+        # (newline-joined so words never merge across message boundaries)
+        words = _PUNCTUATION_RE.sub('', '\n'.join(contents).lower()).split()
+        
+        # Count each word, skipping ones that are too short or stop words
+        word_counts.update(
+            word for word in words
+            if len(word) >= 3 and word not in _STOP_WORDS
+        )
+    
+    stats['total_messages'] = total_messages
+    
+    # Turn the per-participant lists back into name-keyed results
+    participants = sorted(role_to_idx)  # Sort for consistent ordering
+    stats['participants'] = participants
+    for p in participants:
+        idx = role_to_idx[p]
+        stats['messages_by_participant'][p] = msg_count[idx]
+        stats['conversations_started_by'][p] = started[idx]
+        stats['msg_len_stats'][p] = [msg_count[idx], msg_sum[idx], msg_max[idx]]
+    
+    # Return stats plus top N topics (most common first)
+    return stats, word_counts.most_common(top_n)
+
+
+def analyze(data, top_n=15):
+    """
+    Calculate statistics and extract topics in a single pass over the data.
+    
+    Args:
+        data: Dictionary from load_conversation_file()
+        top_n: Number of top topics to return
+        
+    Returns:
+        Tuple of (stats dictionary, list of (word, count) topic tuples)
+    """
+    return analyze_conversations(data['conversations'], data['date'], top_n)
+
+
+def get_basic_stats(data):
+    """
+    Calculate basic statistics from conversation data.
+    
+    Args:
+        data: Dictionary from load_conversation_file()
+        
+    Returns:
+        Dictionary with statistics
+    """
+    return analyze(data)[0]
+
+
+def extract_topics(data, top_n=15):
+    """
+    Extract main topics from conversations using keyword frequency.
     
-    return stats
+    Args:
+        data: Dictionary from load_conversation_file()
+        top_n: Number of top topics to return
+        
+    Returns:
+        List of (word, count) tuples sorted by frequency
+    """
+    return analyze(data, top_n)[1]
 
 
 def print_stats(stats):
@@ -314,10 +444,9 @@ def print_stats(stats):
     
     # Show message length stats for each participant
     for participant in stats['participants']:
-        lengths = stats['message_lengths_by_participant'][participant]
-        if lengths:
-            avg = sum(lengths) / len(lengths)
-            longest = max(lengths)
+        count, total_length, longest = stats['msg_len_stats'][participant]
+        if count:
+            avg = total_length / count
             print(f"\n{participant}'s Messages:")
             print(f"  - Average length: {avg:.0f} characters")
             print(f"  - Longest message: {longest} characters")
@@ -355,25 +484,26 @@ def main():
     
     filepath = sys.argv[1]
     
-    # Check if file exists
+    # Check if file exists (JSON errors can also surface mid-analysis when streaming)
     try:
         print(f"Loading conversation file: {filepath}...")
-        data = load_conversation_file(filepath)
+        if ijson is not None and os.path.getsize(filepath) > _STREAM_THRESHOLD_BYTES:
+            date, conversations = stream_conversation_file(filepath)
+        else:
+            data = load_conversation_file(filepath)
+            date, conversations = data['date'], data['conversations']
+        
+        print("Calculating statistics and extracting topics...")
+        stats, topics = analyze_conversations(conversations, date)
     except FileNotFoundError:
         print(f"\nError: File '{filepath}' not found!")
         print("Make sure the file exists in the current directory.\n")
         sys.exit(1)
-    except json.JSONDecodeError:
+    except _JSON_ERRORS:
         print(f"\nError: File '{filepath}' is not valid JSON!")
         print("Make sure it's a properly formatted JSON file.\n")
         sys.exit(1)
     
-    print("Calculating statistics...")
-    stats = get_basic_stats(data)
-    
-    print("Extracting topics...")
-    topics = extract_topics(data)
-    
     print_stats(stats)
     print_topics(topics)
 